@@ -10,6 +10,7 @@ Usage:
     python run-benchmark.py --group B          # Run treatment group (plugin)
     python run-benchmark.py --compile          # Compile results from both groups
     python run-benchmark.py --group A --test CQ.1   # Run a single test
+    python run-benchmark.py --group A --concurrency 4   # Run 4 tests at a time
 
 Prerequisites:
     - Claude CLI installed and authenticated
@@ -21,27 +22,96 @@ Prerequisites:
 import argparse
 import json
 import math
-import os
 import re
 import statistics
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is missing
+    orjson = None
+
 BASE_DIR = Path(__file__).parent
 TEST_CASES_DIR = BASE_DIR / "test-cases"
 RESULTS_DIR = BASE_DIR / "results"
 
+# Two-sided 95% t critical values by sample size (df = n - 1)
+_T_VALUES_95 = {2: 12.71, 3: 4.30, 4: 3.18, 5: 2.78, 6: 2.57,
+                7: 2.45, 8: 2.36, 9: 2.31, 10: 2.26}
+
+_VIOLATION_RE = re.compile(r"\[Cycle \d+ - ([a-z0-9-]+)\]")
+
+_JSON_OBJECT_RE = re.compile(r"\s*\{")
+
+# Serializes console output so concurrent runs don't interleave their blocks.
+_PRINT_LOCK = threading.Lock()
+
+_CREATED_DIRS = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+
+def _ensure_dir(path):
+    """Create path (and parents) once per process; later calls are a set lookup."""
+    key = str(path)
+    with _CREATED_DIRS_LOCK:
+        if key in _CREATED_DIRS:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
+
+
+_JSONL_LOCK = threading.Lock()
+
+
+def _append_jsonl(path, obj):
+    """Append obj to path as a single compact JSON line."""
+    if orjson is not None:
+        line = orjson.dumps(obj) + b"\n"
+    else:
+        line = json.dumps(obj).encode("utf-8") + b"\n"
+    with _JSONL_LOCK, open(path, "ab") as f:
+        f.write(line)
+
+
+def _json_loads(data):
+    """Decode a JSON str/bytes payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path):
+    """Load a JSON file written by this runner or by auto-grade.py."""
+    return _json_loads(Path(path).read_bytes())
+
+
+def _write_json(path, obj):
+    """Write obj to path as 2-space indented JSON."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2)
+
+
+def load_test_cases(test_ids=None):
+    """Load test cases from JSON files.
 
-def load_test_cases():
-    """Load all test cases from JSON files."""
+    If test_ids is given, cases with other IDs are skipped while loading.
+    """
     all_cases = []
     for json_file in sorted(TEST_CASES_DIR.glob("category-*.json")):
         with open(json_file, "r", encoding="utf-8-sig") as f:
             data = json.load(f)
         category = data["category"]
         for tc in data["test_cases"]:
+            if test_ids is not None and tc["id"] not in test_ids:
+                continue
             tc["_category"] = category
             tc["_file"] = json_file.name
             all_cases.append(tc)
@@ -56,12 +126,8 @@ def parse_violations(stderr_text):
       Quadruple Verification BLOCKED ...
     Returns a list of rule IDs that were triggered.
     """
-    violations = []
-    # Match [Cycle N - rule-name] patterns
-    for match in re.finditer(r"\[Cycle \d+ - ([a-z0-9-]+)\]", stderr_text):
-        rule = match.group(1)
-        if rule not in violations:
-            violations.append(rule)
+    # Match [Cycle N - rule-name] patterns, de-duplicated in first-seen order
+    violations = list(dict.fromkeys(_VIOLATION_RE.findall(stderr_text)))
     # Also check for generic BLOCKED messages
     if "BLOCKED" in stderr_text and not violations:
         violations.append("blocked-generic")
@@ -76,61 +142,84 @@ def run_single_test(test_case, group, run_number=1):
     test_id = test_case["id"]
     prompt = test_case["prompt"]
 
-    print(f"\n{'='*60}")
-    print(f"Running: {test_id} ({test_case['name']})")
-    print(f"Group: {'Control (A) - Vanilla' if group == 'A' else 'Treatment (B) - Plugin'}")
-    print(f"Run: {run_number}")
-    print(f"{'='*60}")
+    with _PRINT_LOCK:
+        print(f"\n{'='*60}")
+        print(f"Running: {test_id} ({test_case['name']})")
+        print(f"Group: {'Control (A) - Vanilla' if group == 'A' else 'Treatment (B) - Plugin'}")
+        print(f"Run: {run_number}")
+        print(f"{'='*60}")
 
     # Create output directory for this run
     run_dir = RESULTS_DIR / f"group-{group}" / test_id / f"run-{run_number}"
-    run_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(run_dir.parent)
+    run_dir.mkdir(exist_ok=True)
 
     # Save the prompt
     (run_dir / "prompt.txt").write_text(prompt, encoding="utf-8")
 
     # Record start time
-    start_time = time.time()
-    start_iso = datetime.now().isoformat()
+    start_ns = time.time_ns()
 
-    # Run Claude CLI in non-interactive mode
+    # Run Claude CLI in non-interactive mode, streaming its stdout/stderr
+    # straight to disk instead of buffering them in memory
+    raw_path = run_dir / "raw-json.json"
+    stderr_path = run_dir / "stderr.txt"
+    timed_out = False
     try:
-        result = subprocess.run(
-            ["claude", "-p", prompt, "--output-format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=900,
-            cwd=str(run_dir),
-            encoding="utf-8",
-            errors="replace"
-        )
-        stdout = result.stdout
-        stderr = result.stderr
-        exit_code = result.returncode
-    except subprocess.TimeoutExpired:
-        stdout = ""
-        stderr = "TIMEOUT: Test exceeded 15 minute limit"
-        exit_code = -1
+        with open(raw_path, "wb") as out_f, open(stderr_path, "wb") as err_f:
+            proc = subprocess.Popen(
+                ["claude", "-p", prompt, "--output-format", "json"],
+                stdout=out_f,
+                stderr=err_f,
+                cwd=str(run_dir),
+            )
+            try:
+                exit_code = proc.wait(timeout=900)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                timed_out = True
+                exit_code = -1
+            except BaseException:
+                # Ctrl-C or any other error: don't orphan a billable session
+                proc.kill()
+                proc.wait()
+                raise
     except FileNotFoundError:
-        print("ERROR: 'claude' CLI not found. Make sure it is installed and in PATH.")
+        with _PRINT_LOCK:
+            print("ERROR: 'claude' CLI not found. Make sure it is installed and in PATH.")
         return None
 
     # Record end time
-    end_time = time.time()
-    end_iso = datetime.now().isoformat()
-    wall_clock = end_time - start_time
+    end_ns = time.time_ns()
+    wall_clock = (end_ns - start_ns) / 1e9
+
+    if timed_out:
+        stdout = ""
+        stderr = "TIMEOUT: Test exceeded 15 minute limit"
+        raw_path.write_bytes(b"")
+        stderr_path.write_text(stderr, encoding="utf-8")
+    else:
+        stdout = raw_path.read_text(encoding="utf-8", errors="replace")
+        # stderr is only needed in memory for Group B violation parsing
+        stderr = stderr_path.read_text(encoding="utf-8", errors="replace") if group == "B" else ""
 
     # Parse JSON output for detailed metrics
     token_count = None
     total_cost = None
     api_latency = None
     claude_output = stdout
+    has_result = False  # True once claude_output is the JSON "result" field
     num_turns = None
     model_usage = {}
     try:
-        parsed = json.loads(stdout)
+        # Only a JSON object carries metrics; don't run the parser (and build a
+        # JSONDecodeError) for empty output, plain-text errors, or timeouts
+        parsed = _json_loads(stdout) if _JSON_OBJECT_RE.match(stdout) else None
         if isinstance(parsed, dict):
-            claude_output = parsed.get("result", stdout)
+            if "result" in parsed:
+                claude_output = parsed["result"]
+                has_result = True
             api_latency = parsed.get("duration_api_ms", None)
             total_cost = parsed.get("total_cost_usd", None)
             num_turns = parsed.get("num_turns", None)
@@ -145,11 +234,15 @@ def run_single_test(test_case, group, run_number=1):
     except (json.JSONDecodeError, TypeError):
         token_count = None
 
-    # Save outputs
-    (run_dir / "stdout.txt").write_text(claude_output, encoding="utf-8")
-    (run_dir / "stderr.txt").write_text(stderr, encoding="utf-8")
-    if stdout != claude_output:
-        (run_dir / "raw-json.json").write_text(stdout, encoding="utf-8")
+    # Save outputs: stderr.txt is already on disk. The raw stdout file is
+    # kept as raw-json.json only when stdout.txt holds the extracted result;
+    # otherwise stdout.txt gets the decoded text (auto-grade.py reads it as
+    # strict UTF-8, so the raw bytes must not be moved there as-is).
+    if has_result:
+        (run_dir / "stdout.txt").write_text(claude_output, encoding="utf-8")
+    else:
+        (run_dir / "stdout.txt").write_text(stdout, encoding="utf-8")
+        raw_path.unlink()
 
     # Parse stderr for plugin violation catches (Group B only)
     violations_caught = parse_violations(stderr) if group == "B" else []
@@ -161,8 +254,8 @@ def run_single_test(test_case, group, run_number=1):
         "category": test_case["_category"],
         "group": group,
         "run_number": run_number,
-        "start_time": start_iso,
-        "end_time": end_iso,
+        "start_time": datetime.fromtimestamp(start_ns / 1e9).isoformat(),
+        "end_time": datetime.fromtimestamp(end_ns / 1e9).isoformat(),
         "latency_seconds": round(wall_clock, 2),
         "api_latency_ms": api_latency,
         "token_count": token_count,
@@ -182,22 +275,27 @@ def run_single_test(test_case, group, run_number=1):
         "notes": ""
     }
 
-    # Save individual result
-    with open(run_dir / "result.json", "w", encoding="utf-8") as f:
-        json.dump(result_record, f, indent=2)
+    # Save individual result, and log it right away so an interrupted
+    # batch keeps every finished run
+    _write_json(run_dir / "result.json", result_record)
+    _append_jsonl(RESULTS_DIR / f"group-{group}-results.jsonl", result_record)
 
     cost_str = f"${total_cost:.4f}" if total_cost else "N/A"
     violations_str = f" | Violations: {len(violations_caught)}" if violations_caught else ""
-    print(f"  Completed in {wall_clock:.1f}s | Tokens: {token_count or 'N/A'} | Cost: {cost_str} | Exit: {exit_code}{violations_str}")
+    with _PRINT_LOCK:
+        print(f"  {test_id} run {run_number} completed in {wall_clock:.1f}s | Tokens: {token_count or 'N/A'} | Cost: {cost_str} | Exit: {exit_code}{violations_str}")
     return result_record
 
 
-def run_group(group, test_filter=None, runs=1):
-    """Run all (or filtered) test cases for a group."""
-    all_cases = load_test_cases()
+def run_group(group, test_filter=None, runs=1, concurrency=1):
+    """Run all (or filtered) test cases for a group.
+
+    Each run is an independent Claude CLI subprocess, so up to `concurrency`
+    of them are executed at once on a thread pool. Results keep test order.
+    """
+    all_cases = load_test_cases({test_filter} if test_filter else None)
 
     if test_filter:
-        all_cases = [tc for tc in all_cases if tc["id"] == test_filter]
         if not all_cases:
             print(f"ERROR: Test case '{test_filter}' not found.")
             return []
@@ -206,18 +304,29 @@ def run_group(group, test_filter=None, runs=1):
     print(f"Total test cases: {len(all_cases)}")
     print(f"Runs per test: {runs}")
     print(f"Total runs: {len(all_cases) * runs}")
-
-    results = []
-    for tc in all_cases:
-        for run_num in range(1, runs + 1):
-            result = run_single_test(tc, group, run_num)
-            if result:
-                results.append(result)
+    print(f"Concurrency: {concurrency}")
+
+    # Start a fresh progress log; run_single_test appends one line per run
+    _ensure_dir(RESULTS_DIR)
+    (RESULTS_DIR / f"group-{group}-results.jsonl").write_bytes(b"")
+
+    tasks = [(tc, run_num) for tc in all_cases for run_num in range(1, runs + 1)]
+    if concurrency == 1:
+        results = [r for r in (run_single_test(tc, group, run_num) for tc, run_num in tasks) if r]
+    else:
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = [pool.submit(run_single_test, tc, group, run_num) for tc, run_num in tasks]
+            results = [r for r in (f.result() for f in futures) if r]
+        except BaseException:
+            # On Ctrl-C or a failed run, don't launch queued (billable) sessions
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
 
     # Save aggregated results for this group
     group_file = RESULTS_DIR / f"group-{group}-results.json"
-    with open(group_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    _write_json(group_file, results)
 
     print(f"\n{'='*60}")
     print(f"Group {group} complete. {len(results)} runs saved to {group_file}")
@@ -237,20 +346,30 @@ def calculate_weighted_score(scores):
     )
 
 
+def _mean_stdev(values):
+    """Return (mean, sample stddev) of a non-empty list, computing the mean once."""
+    if len(values) == 1:
+        return values[0], 0.0
+    mean = statistics.fmean(values)
+    return mean, statistics.stdev(values, xbar=mean)
+
+
 def calculate_stats(values):
     """Calculate mean, stddev, 95% CI, and count for a list of values."""
-    n = len(values)
+    if not values:
+        return _stats_from(0, 0, 0)
+    return _stats_from(len(values), *_mean_stdev(values))
+
+
+def _stats_from(n, mean, stddev):
+    """Build the calculate_stats dict from an already computed mean/stddev."""
     if n == 0:
         return {"mean": 0, "stddev": 0, "ci_95_lower": 0, "ci_95_upper": 0, "count": 0}
-    mean = statistics.mean(values)
     if n < 2:
         return {"mean": round(mean, 2), "stddev": 0, "ci_95_lower": round(mean, 2),
                 "ci_95_upper": round(mean, 2), "count": n}
-    stddev = statistics.stdev(values)
     # 95% CI using t-distribution approximation (1.96 for large n, wider for small n)
-    t_value = 1.96 if n >= 30 else {2: 12.71, 3: 4.30, 4: 3.18, 5: 2.78,
-                                      6: 2.57, 7: 2.45, 8: 2.36, 9: 2.31,
-                                      10: 2.26}.get(n, 2.0)
+    t_value = 1.96 if n >= 30 else _T_VALUES_95.get(n, 2.0)
     margin = t_value * (stddev / math.sqrt(n))
     return {
         "mean": round(mean, 2),
@@ -261,17 +380,58 @@ def calculate_stats(values):
     }
 
 
-def detect_outliers(values):
-    """Flag indices of values more than 2 SD from the mean."""
+def detect_outliers(values, mean=None, stddev=None):
+    """Flag indices of values more than 2 SD from the mean.
+
+    Pass mean/stddev when they are already known to skip recomputing them.
+    """
     if len(values) < 3:
         return []
-    mean = statistics.mean(values)
-    stddev = statistics.stdev(values)
+    if mean is None or stddev is None:
+        mean, stddev = _mean_stdev(values)
     if stddev == 0:
         return []
     return [i for i, v in enumerate(values) if abs(v - mean) > 2 * stddev]
 
 
+def _summarize_runs(tid, runs):
+    """Summarize all scored runs of one test into its averaged-per-test dict."""
+    scores, latencies, tokens = [], [], []
+    for r in runs:
+        scores.append(r["scores"]["weighted_total"])
+        latencies.append(r["latency_seconds"])
+        if r["token_count"] is not None:
+            tokens.append(r["token_count"])
+    score_mean, score_sd = _mean_stdev(scores)
+    latency_mean, latency_sd = _mean_stdev(latencies)
+    token_mean, token_sd = _mean_stdev(tokens) if tokens else (0, 0)
+    return {
+        "test_id": tid,
+        "category": runs[0]["category"],
+        "scores_all": scores,
+        "score_stats": _stats_from(len(scores), score_mean, score_sd),
+        "score_outliers": detect_outliers(scores, score_mean, score_sd),
+        "avg_score": score_mean,
+        "latencies_all": latencies,
+        "latency_stats": _stats_from(len(latencies), latency_mean, latency_sd),
+        "avg_latency": latency_mean,
+        "tokens_all": tokens,
+        "token_stats": _stats_from(len(tokens), token_mean, token_sd) if tokens else None,
+        "avg_tokens": token_mean,
+        "n_runs": len(runs),
+        "violations_caught": list({rule for r in runs for rule in r.get("violations_caught", [])}),
+    }
+
+
+def _aggregate_by_id(results):
+    """Group scored results by test_id and summarize each test's runs."""
+    by_id = {}  # test_id -> [list of scored results across runs]
+    for r in results:
+        if r["scores"]["weighted_total"] is not None:
+            by_id.setdefault(r["test_id"], []).append(r)
+    return {tid: _summarize_runs(tid, runs) for tid, runs in by_id.items()}
+
+
 def compile_results():
     """Compile results from both groups into the final summary."""
     group_a_file = RESULTS_DIR / "group-A-results.json"
@@ -284,10 +444,8 @@ def compile_results():
         print("  python run-benchmark.py --group B")
         return
 
-    with open(group_a_file, "r", encoding="utf-8") as f:
-        group_a = json.load(f)
-    with open(group_b_file, "r", encoding="utf-8") as f:
-        group_b = json.load(f)
+    group_a = _read_json(group_a_file)
+    group_b = _read_json(group_b_file)
 
     # Check for ungraded results
     ungraded_a = [r for r in group_a if r["scores"]["weighted_total"] is None]
@@ -308,79 +466,30 @@ def compile_results():
         "Adversarial": "category_6_adversarial"
     }
 
-    # Build multi-run index: collect ALL runs per test_id
-    a_by_id_all = {}  # test_id -> [list of scored results across runs]
-    for r in group_a:
-        if r["scores"]["weighted_total"] is not None:
-            a_by_id_all.setdefault(r["test_id"], []).append(r)
-
-    b_by_id_all = {}
-    for r in group_b:
-        if r["scores"]["weighted_total"] is not None:
-            b_by_id_all.setdefault(r["test_id"], []).append(r)
-
-    # Build averaged-per-test dicts for backward compatibility
-    a_by_id_avg = {}
-    for tid, runs in a_by_id_all.items():
-        scores = [r["scores"]["weighted_total"] for r in runs]
-        latencies = [r["latency_seconds"] for r in runs]
-        tokens = [r["token_count"] for r in runs if r["token_count"] is not None]
-        a_by_id_avg[tid] = {
-            "test_id": tid,
-            "category": runs[0]["category"],
-            "scores_all": scores,
-            "score_stats": calculate_stats(scores),
-            "score_outliers": detect_outliers(scores),
-            "avg_score": statistics.mean(scores),
-            "latencies_all": latencies,
-            "latency_stats": calculate_stats(latencies),
-            "avg_latency": statistics.mean(latencies),
-            "tokens_all": tokens,
-            "token_stats": calculate_stats(tokens) if tokens else None,
-            "avg_tokens": statistics.mean(tokens) if tokens else 0,
-            "n_runs": len(runs),
-            "violations_caught": list({rule for r in runs for rule in r.get("violations_caught", [])}),
-        }
-
-    b_by_id_avg = {}
-    for tid, runs in b_by_id_all.items():
-        scores = [r["scores"]["weighted_total"] for r in runs]
-        latencies = [r["latency_seconds"] for r in runs]
-        tokens = [r["token_count"] for r in runs if r["token_count"] is not None]
-        b_by_id_avg[tid] = {
-            "test_id": tid,
-            "category": runs[0]["category"],
-            "scores_all": scores,
-            "score_stats": calculate_stats(scores),
-            "score_outliers": detect_outliers(scores),
-            "avg_score": statistics.mean(scores),
-            "latencies_all": latencies,
-            "latency_stats": calculate_stats(latencies),
-            "avg_latency": statistics.mean(latencies),
-            "tokens_all": tokens,
-            "token_stats": calculate_stats(tokens) if tokens else None,
-            "avg_tokens": statistics.mean(tokens) if tokens else 0,
-            "n_runs": len(runs),
-            "violations_caught": list({rule for r in runs for rule in r.get("violations_caught", [])}),
-        }
-
-    # Matched tests: scored in BOTH groups
-    matched_ids = set(a_by_id_avg.keys()) & set(b_by_id_avg.keys())
-    total_a = len(group_a)
-    total_b = len(group_b)
-    max_runs = max((a_by_id_avg[tid]["n_runs"] for tid in matched_ids), default=1)
-    print(f"Matched tests: {len(matched_ids)} of {max(total_a, total_b)} (max {max_runs} run(s) per test)")
+    # Build averaged-per-test dicts (all scored runs per test_id)
+    a_by_id_avg = _aggregate_by_id(group_a)
+    b_by_id_avg = _aggregate_by_id(group_b)
 
     # Violation tracking (Group B only)
     total_violations_b = 0
     tests_with_violations = 0
-    all_rules_triggered = []
+    rules_triggered = set()
     for r in group_b:
         v = r.get("violations_caught", [])
         if v:
             total_violations_b += len(v)
             tests_with_violations += 1
-            all_rules_triggered.extend(v)
+            rules_triggered.update(v)
+
+    # Matched tests: scored in BOTH groups
+    matched_ids = set(a_by_id_avg.keys()) & set(b_by_id_avg.keys())
+    matched_by_category = {}  # category name -> [matched test_ids]
+    for tid in matched_ids:
+        matched_by_category.setdefault(a_by_id_avg[tid]["category"], []).append(tid)
+    total_a = len(group_a)
+    total_b = len(group_b)
+    max_runs = max((a_by_id_avg[tid]["n_runs"] for tid in matched_ids), default=1)
+    print(f"Matched tests: {len(matched_ids)} of {max(total_a, total_b)} (max {max_runs} run(s) per test)")
 
     # Safety scan results (if present)
     a_safety_violations = sum(len(r.get("safety_violations", [])) for r in group_a)
@@ -389,8 +498,7 @@ def compile_results():
     summary = {}
     for cat_name, cat_key in category_map.items():
         # Matched-only: only tests graded in both groups
-        cat_matched = [tid for tid in matched_ids
-                       if a_by_id_avg[tid]["category"] == cat_name]
+        cat_matched = matched_by_category.get(cat_name, [])
 
         if not cat_matched:
             summary[cat_key] = {"status": "incomplete", "matched": 0,
@@ -405,19 +513,20 @@ def compile_results():
         a_tokens = [a_by_id_avg[tid]["avg_tokens"] for tid in cat_matched if a_by_id_avg[tid]["avg_tokens"] > 0]
         b_tokens = [b_by_id_avg[tid]["avg_tokens"] for tid in cat_matched if b_by_id_avg[tid]["avg_tokens"] > 0]
 
-        avg_a = statistics.mean(a_scores)
-        avg_b = statistics.mean(b_scores)
+        # One mean/stddev pass per list; stats dicts reuse the same values
+        avg_a, sd_a = _mean_stdev(a_scores)
+        avg_b, sd_b = _mean_stdev(b_scores)
         improvement = ((avg_b - avg_a) / avg_a * 100) if avg_a > 0 else 0
 
-        stats_a = calculate_stats(a_scores)
-        stats_b = calculate_stats(b_scores)
+        stats_a = _stats_from(len(a_scores), avg_a, sd_a)
+        stats_b = _stats_from(len(b_scores), avg_b, sd_b)
 
-        avg_lat_a = statistics.mean(a_latencies)
-        avg_lat_b = statistics.mean(b_latencies)
+        avg_lat_a = statistics.fmean(a_latencies)
+        avg_lat_b = statistics.fmean(b_latencies)
         lat_ratio = avg_lat_b / avg_lat_a if avg_lat_a > 0 else 0
 
-        avg_tok_a = statistics.mean(a_tokens) if a_tokens else 0
-        avg_tok_b = statistics.mean(b_tokens) if b_tokens else 0
+        avg_tok_a = statistics.fmean(a_tokens) if a_tokens else 0
+        avg_tok_b = statistics.fmean(b_tokens) if b_tokens else 0
         tok_ratio = avg_tok_b / avg_tok_a if avg_tok_a > 0 else 0
 
         # Net Value Score = Quality Improvement % - (Latency Penalty + Token Penalty)
@@ -426,8 +535,7 @@ def compile_results():
         net_value = improvement - latency_penalty - token_penalty
 
         # Count violations and outliers in this category
-        cat_violations = sum(len(b_by_id_avg[tid].get("violations_caught", []))
-                            for tid in cat_matched if tid in b_by_id_avg)
+        cat_violations = sum(len(b_by_id_avg[tid]["violations_caught"]) for tid in cat_matched)
         total_outliers_a = sum(len(a_by_id_avg[tid]["score_outliers"]) for tid in cat_matched)
         total_outliers_b = sum(len(b_by_id_avg[tid]["score_outliers"]) for tid in cat_matched)
 
@@ -478,7 +586,7 @@ def compile_results():
             "violations": {
                 "total_plugin_catches": total_violations_b,
                 "tests_with_catches": tests_with_violations,
-                "rules_triggered": list(set(all_rules_triggered)),
+                "rules_triggered": list(rules_triggered),
                 "vanilla_safety_violations": a_safety_violations,
                 "plugin_safety_violations": b_safety_violations,
                 "safety_gap": a_safety_violations - b_safety_violations
@@ -488,8 +596,7 @@ def compile_results():
     # Save compiled results
     today = datetime.now().strftime("%Y-%m-%d")
     compiled_file = RESULTS_DIR / f"run-{today}.json"
-    with open(compiled_file, "w", encoding="utf-8") as f:
-        json.dump({"date": today, "summary": summary}, f, indent=2)
+    _write_json(compiled_file, {"date": today, "summary": summary})
 
     # Print summary table
     print(f"\n{'='*90}")
@@ -539,11 +646,24 @@ def compile_results():
     print(f"\nFull results saved to: {compiled_file}")
 
 
+def _positive_int(value):
+    """argparse type for options that must be >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {number}")
+    return number
+
+
 def main():
     arg_parser = argparse.ArgumentParser(description="Quadruple Verification Benchmark Runner")
     arg_parser.add_argument("--group", choices=["A", "B"], help="Run tests for group A (control) or B (treatment)")
     arg_parser.add_argument("--test", help="Run a specific test case by ID (e.g., CQ.1)")
     arg_parser.add_argument("--runs", type=int, default=1, help="Number of runs per test (default: 1 for quick mode)")
+    arg_parser.add_argument("--concurrency", type=_positive_int, default=1,
+                            help="Number of tests to run in parallel (default: 1)")
     arg_parser.add_argument("--compile", action="store_true", help="Compile and summarize results from both groups")
     arg_parser.add_argument("--list", action="store_true", help="List all test cases")
 
@@ -561,7 +681,7 @@ def main():
         return
 
     if args.group:
-        run_group(args.group, test_filter=args.test, runs=args.runs)
+        run_group(args.group, test_filter=args.test, runs=args.runs, concurrency=args.concurrency)
         return
 
     arg_parser.print_help()